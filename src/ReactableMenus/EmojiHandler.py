@@ -1,18 +1,19 @@
-from typing import Any, Dict, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 import emoji
 from discord import PartialEmoji, Emoji
 
 
-def string_to_partial_emoji(string_emoji: str) -> PartialEmoji:
-    """Turn a string into a PartialEmoji object.
+@lru_cache(maxsize=512)
+def parse_string_emoji(string_emoji: str) -> Optional[Tuple[str, Optional[str], bool]]:
+    """Parse the data of an emoji out of a string.
 
     Args:
-        string_emoji (str): The string containing emoji data.
+        string_emoji (str): The stripped string containing emoji data.
 
     Returns:
-        PartialEmoji: The PartialEmoji representing the given string.
+        Optional[Tuple[str, Optional[str], bool]]: The name, ID and animated state of the emoji, or None if the string is not an emoji.
     """
-    string_emoji = string_emoji.strip()
     converted_emoji = emoji.demojize(string_emoji, use_aliases=True)
     if converted_emoji == string_emoji:
         # Emojis should be in the format <a:name:id>
@@ -24,11 +25,28 @@ def string_to_partial_emoji(string_emoji: str) -> PartialEmoji:
         emoji_name = string_emoji[first_colon_index + 1 : last_colon_index]
         emoji_id = string_emoji[last_colon_index + 1 : -1]
 
-        emoji_data = {"name": emoji_name, "id": emoji_id, "animated": animated}
-    else:
-        emoji_data = {"name": string_emoji, "id": None, "animated": False}
+        return emoji_name, emoji_id, animated
 
-    return PartialEmoji.from_dict(emoji_data)
+    return string_emoji, None, False
+
+
+def string_to_partial_emoji(string_emoji: str) -> PartialEmoji:
+    """Turn a string into a PartialEmoji object.
+
+    Args:
+        string_emoji (str): The string containing emoji data.
+
+    Returns:
+        PartialEmoji: The PartialEmoji representing the given string.
+    """
+    emoji_data = parse_string_emoji(string_emoji.strip())
+    if emoji_data is None:
+        return None
+
+    emoji_name, emoji_id, animated = emoji_data
+    return PartialEmoji.from_dict(
+        {"name": emoji_name, "id": emoji_id, "animated": animated}
+    )
 
 
 def emoji_to_partial_emoji(full_emoji: Emoji) -> PartialEmoji:
@@ -1,5 +1,7 @@
-from abc import abstractmethod
-from typing import Any, Callable, Dict, Tuple, Union
+import asyncio
+import logging
+from weakref import WeakKeyDictionary
+from typing import Any, Callable, Dict, List, Tuple, Union
 from discord import (
     Emoji,
     HTTPException,
@@ -28,15 +30,44 @@ __all__ = [
     "MenuOption",
 ]
 
+logger = logging.getLogger(__name__)
+
+EMBED_FIELD_LIMIT = 25
+EMBED_LIMIT = 10
+EMBED_CHARACTER_LIMIT = 6000
+SELECT_OPTION_LIMIT = 25
+# A view has 5 rows and the toggle button takes up one of them
+SELECT_MENU_LIMIT = 4
+
 
 class MenuBase:
+    __slots__ = (
+        "title",
+        "title_disabled_suffix",
+        "description",
+        "description_meta",
+        "enabled_color",
+        "disabled_color",
+        "options",
+        "message",
+        "message_id",
+        "channel",
+        "guild",
+        "channel_id",
+        "guild_id",
+        "use_inline",
+        "show_id",
+        "auto_enable",
+        "enabled",
+    )
+
     def __init__(
         self,
         title: str,
         title_disabled_suffix: str = "Disabled",
         description: str = "",
         description_meta: str = "",
-        options: Dict = {},
+        options: Dict = None,
         enabled_color: Color = Color.green(),
         disabled_color: Color = Color.red(),
         message_id: int = None,
@@ -53,7 +84,7 @@ class MenuBase:
             title_disabled_suffix (str, optional): The suffix to append to the title when the menu is disabled. Defaults to "Disabled".
             description (str, optional): The description of the menu. Can be used to provide more information about the menu to the user. Defaults to "".
             description_meta (str, optional): Additional notes for the description, again can be used to help inform the user about the menu. Defaults to "".
-            options (Dict, optional): The options to be present in the menu. Defaults to {}.
+            options (Dict, optional): The options to be present in the menu. Defaults to None.
             enabled_color (Color, optional): The embed color to use when the menu is enabled. Defaults to Color.green().
             disabled_color (Color, optional): The embed color to use when the menu is disabled. Defaults to Color.red().
             message_id (int, optional): The ID of the messsage the menu is tied to. Defaults to None.
@@ -68,7 +99,7 @@ class MenuBase:
         self.description_meta = description_meta
         self.enabled_color = enabled_color
         self.disabled_color = disabled_color
-        self.options = options
+        self.options = options if options is not None else {}
 
         self.message = message
         self.message_id = message_id
@@ -100,13 +131,13 @@ class MenuBase:
         Returns:
             ReactableMenu: The MenuBase object that was created from the given data dictionary.
         """
-        options_list = [MenuOption(x) for x in data.get("options", [])]
+        options_list = [MenuOption.from_dict(x) for x in data.get("options", [])]
         data["options"] = {x.id: x for x in options_list}
         if data.get("enabled_color"):
             data["enabled_color"] = Color(int(data.get("enabled_color")))
         if data.get("disabled_color"):
             data["disabled_color"] = Color(int(data.get("disabled_color")))
-        return MenuBase(**data)
+        return cls(**data)
 
     def to_dict(self) -> Dict:
         """Creates a dictionary from a menu. Allows for saving and with from_dict loading of menus to a database.
@@ -129,24 +160,21 @@ class MenuBase:
         }
         return data
 
-    @abstractmethod
     def send_menu(self, channel: GuildChannel):
         """Used to send the menu to a channel. This method sets the message attribute, builds the menu and then sends it.
 
         Args:
             channel (GuildChannel): The channel to send the menu in.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def enable(self, *args, **kwargs):
         """Method used to enable the menu."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def disable(self, *args, **kwargs):
         """Method used to disable the menu"""
-        pass
+        raise NotImplementedError
 
     @property
     def id(self) -> int:
@@ -216,6 +244,56 @@ class MenuBase:
 
         return embed
 
+    def build_embeds(self) -> List[Embed]:
+        """Build the embed objects for the menu. If the menu has more options than Discord allows in a single embed, the options are split over multiple embeds.
+
+        Returns:
+            List[Embed]: The embed objects that represent a ReactableMenu.
+
+        Raises:
+            ValueError: If the menu has more options or text than can fit in the embeds of a single message.
+        """
+        embed = self.build_embed()
+        fields = embed.fields
+        if len(fields) > EMBED_FIELD_LIMIT * EMBED_LIMIT:
+            raise ValueError(
+                f"Menu cannot have more than {EMBED_FIELD_LIMIT * EMBED_LIMIT} options"
+            )
+
+        embeds = [embed]
+        if len(fields) > EMBED_FIELD_LIMIT:
+            embed.clear_fields()
+            for index in range(0, len(fields), EMBED_FIELD_LIMIT):
+                if index:
+                    embeds.append(Embed(color=embed.color))
+                for field in fields[index : index + EMBED_FIELD_LIMIT]:
+                    embeds[-1].add_field(
+                        name=field.name, value=field.value, inline=field.inline
+                    )
+
+            # The footer belongs at the bottom of the menu, after the last of the options
+            if embed.footer.text:
+                embeds[-1].set_footer(
+                    text=embed.footer.text, icon_url=embed.footer.icon_url
+                )
+                embed.remove_footer()
+
+        # Discord also limits the combined text of all the embeds in a message
+        if sum(len(embed) for embed in embeds) > EMBED_CHARACTER_LIMIT:
+            raise ValueError(
+                f"Menu cannot have more than {EMBED_CHARACTER_LIMIT} characters in its embeds"
+            )
+
+        return embeds
+
+    def check_limits(self) -> None:
+        """Check that the menu fits within Discord's limits for a single message. Used before sending so that a menu that is too large does not leave a placeholder message behind.
+
+        Raises:
+            ValueError: If the menu does not fit in a single message.
+        """
+        self.build_embeds()
+
     def generate_title(self) -> str:
         """Generate the title text for the embed.
 
@@ -231,15 +309,9 @@ class MenuBase:
         Returns:
             str: The description text for the embed.
         """
-        description = ""
-
-        if self.description:
-            description += self.description
-
-        if self.description_meta:
-            description += f"\n{self.description_meta}"
-
-        return description
+        return "\n".join(
+            part for part in (self.description, self.description_meta) if part
+        )
 
     def get_current_color(self) -> Color:
         """Get the correct color based on if the menu is enabled or disabled.
@@ -272,6 +344,8 @@ class MenuBase:
 
 
 class InteractionMenu(MenuBase):
+    __slots__ = ("interaction_handler", "view")
+
     def __init__(
         self,
         title: str,
@@ -300,7 +374,7 @@ class InteractionMenu(MenuBase):
             self.enabled = True
             if not self.message:
                 raise ValueError("ReactionMenu cannot be enabled before it is sent")
-            await self.message.edit(embed=self.build_embed(), view=self.build_view())
+            await self.message.edit(embeds=self.build_embeds(), view=self.build_view())
 
     async def disable(self) -> None:
         """Disable the current menu."""
@@ -308,7 +382,7 @@ class InteractionMenu(MenuBase):
             self.enabled = False
             if not self.message:
                 return None
-            await self.message.edit(embed=self.build_embed(), view=self.build_view())
+            await self.message.edit(embeds=self.build_embeds(), view=self.build_view())
 
     async def send_menu(self, channel: GuildChannel) -> Message:
         """Send the menu to a given channel.
@@ -318,14 +392,19 @@ class InteractionMenu(MenuBase):
 
         Returns:
             Message: The message that was created by the menu and in which the menu is.
+
+        Raises:
+            ValueError: If the menu does not fit in a single message.
         """
+        self.check_limits()
+
         # Send a temporary message so that we have an exisiting message object to reference
         self.message = await channel.send("_Building reaction menu..._")
         self.message_id = self.message.id
         self.enabled = self.auto_enable
 
         await self.message.edit(
-            content="​", embed=self.build_embed(), view=self.build_view()
+            content="​", embeds=self.build_embeds(), view=self.build_view()
         )
         return self.message
 
@@ -342,18 +421,20 @@ class InteractionMenu(MenuBase):
             # Ignore empty interactions
             return False
 
-        if interaction.message.id != self.message_id:
+        if interaction.message is None or interaction.message.id != self.message_id:
             # Interactions that belong to other messages will be handled by other menus/cogs
             return False
 
-        interaction_id = interaction.data.get("custom_id")
+        interaction_id = (interaction.data or {}).get("custom_id", "")
+        # Custom IDs are in the format <action>_<message id>
+        action = interaction_id.rpartition("_")[0]
 
         # The enable/disable buttons need to be handled seperately from the rest of the menu
-        if "enable" in interaction_id:
+        if action == "enable":
             await self.enable()
             await interaction.response.send_message("Menu enabled!", ephemeral=True)
             return True
-        elif "disable" in interaction_id:
+        elif action == "disable":
             await self.disable()
             await interaction.response.send_message("Menu disabled!", ephemeral=True)
             return True
@@ -362,17 +443,42 @@ class InteractionMenu(MenuBase):
             try:
                 await self.interaction_handler(self, interaction)
                 return True
-            except:
-                await interaction.response.send_message(
-                    "There was an error handling your interaction, please contact a developer",
-                    ephemeral=True,
+            except Exception:
+                logger.exception(
+                    "Error handling interaction for menu %s", self.message_id
                 )
+                # The handler may have already responded before raising
+                if not interaction.response.is_done():
+                    await interaction.response.send_message(
+                        "There was an error handling your interaction, please contact a developer",
+                        ephemeral=True,
+                    )
         else:
             await interaction.response.send_message(
                 content="This menu is currently disabled!", ephemeral=True
             )
         return False
 
+    def build_toggle_button(self) -> Button:
+        """Build the button used to enable or disable the menu, based on if the menu is currently enabled.
+
+        Returns:
+            Button: The button that toggles the state of the menu.
+        """
+        if self.enabled:
+            return Button(
+                label="",
+                emoji="⏹️",
+                custom_id=f"disable_{self.message_id}",
+                style=ButtonStyle.red,
+            )
+        return Button(
+            label="",
+            emoji="▶️",
+            custom_id=f"enable_{self.message_id}",
+            style=ButtonStyle.green,
+        )
+
     def build_view(self, is_persistent: bool = False, timeout: int = 180) -> View:
         """Build the view object that represents a menu. Can be then sent in a message.
 
@@ -390,6 +496,8 @@ class InteractionMenu(MenuBase):
 
 
 class ButtonMenu(InteractionMenu):
+    __slots__ = ("button_labels", "button_style")
+
     def __init__(
         self,
         title: str,
@@ -409,6 +517,20 @@ class ButtonMenu(InteractionMenu):
         self.button_labels = button_labels
         self.button_style = button_style
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ButtonMenu":
+        """Creates a ButtonMenu object from a dictionary of kwargs. Can be used to load a menu from a database.
+
+        Args:
+            data (Dict): The data used to instantiate a new menu.
+
+        Returns:
+            ButtonMenu: The ButtonMenu object that was created from the given data dictionary.
+        """
+        if data.get("button_style") is not None:
+            data["button_style"] = ButtonStyle(int(data.get("button_style")))
+        return super().from_dict(data)
+
     def to_dict(self) -> Dict:
         """Creates a dictionary from a menu. Allows for saving and with from_dict loading of menus to a database.
 
@@ -416,7 +538,7 @@ class ButtonMenu(InteractionMenu):
             Dict: The dictionary representation of a menu.
         """
         data = super().to_dict()
-        data["button_style"] = self.button_style
+        data["button_style"] = self.button_style.value
         data["button_labels"] = self.button_labels
         return data
 
@@ -435,16 +557,9 @@ class ButtonMenu(InteractionMenu):
         else:
             self.view = View(timeout=timeout)
 
-        if self.enabled:
-            self.view.add_item(
-                Button(
-                    label="",
-                    emoji="⏹️",
-                    custom_id=f"disable_{self.message_id}",
-                    style=ButtonStyle.red,
-                )
-            )
+        self.view.add_item(self.build_toggle_button())
 
+        if self.enabled:
             for emoji_id, option in self.options.items():
                 self.view.add_item(
                     Button(
@@ -454,15 +569,6 @@ class ButtonMenu(InteractionMenu):
                         style=self.button_style,
                     )
                 )
-        else:
-            self.view.add_item(
-                Button(
-                    label="",
-                    emoji="▶️",
-                    custom_id=f"enable_{self.message_id}",
-                    style=ButtonStyle.green,
-                )
-            )
 
         self.view = super().build_view()
 
@@ -470,6 +576,8 @@ class ButtonMenu(InteractionMenu):
 
 
 class SelectMenu(InteractionMenu):
+    __slots__ = ("menu_labels", "placeholder", "max_select_count")
+
     def __init__(
         self,
         title: str,
@@ -484,7 +592,7 @@ class SelectMenu(InteractionMenu):
             title (str): The title of the menu. Is used as the title in the embed.
             menu_labels (bool, optional): Toggles if the options in the menu should have the label in them or only the emoji. Defaults to False.
             placeholder (str, optional): The placeholder string that displays in the menu selector. Defaults to "".
-            max_select_count (int, optional): The maximum number of items a user can select from the menu. Defaults to 25.
+            max_select_count (int, optional): The maximum number of items a user can select from each select menu of the menu. Defaults to 25.
         """
         super().__init__(title, **kwargs)
         self.menu_labels = menu_labels
@@ -503,6 +611,26 @@ class SelectMenu(InteractionMenu):
         data["max_select_count"] = self.max_select_count
         return data
 
+    def check_limits(self) -> None:
+        """Check that the menu fits within Discord's limits for a single message. Used before sending so that a menu that is too large does not leave a placeholder message behind.
+
+        Raises:
+            ValueError: If the menu does not fit in a single message.
+        """
+        super().check_limits()
+        self._check_option_count()
+
+    def _check_option_count(self) -> None:
+        """Check that the options of the menu fit in the select menus of a single view.
+
+        Raises:
+            ValueError: If the menu has more options than can fit in the select menus of a single view.
+        """
+        if len(self.options) > SELECT_OPTION_LIMIT * SELECT_MENU_LIMIT:
+            raise ValueError(
+                f"SelectMenu cannot have more than {SELECT_OPTION_LIMIT * SELECT_MENU_LIMIT} options"
+            )
+
     def build_view(self, is_persistent: bool = False, timeout: int = 180) -> View:
         """Build the view object that represents a menu. Can be then sent in a message.
 
@@ -512,7 +640,12 @@ class SelectMenu(InteractionMenu):
 
         Returns:
             View: The view object that represent a SelectMenu.
+
+        Raises:
+            ValueError: If the menu has more options than can fit in the select menus of a single view.
         """
+        self._check_option_count()
+
         if is_persistent:
             self.view = View(timeout=None)
         else:
@@ -528,41 +661,68 @@ class SelectMenu(InteractionMenu):
                 )
             )
 
-        select_menu = Select(
-            max_values=min(len(select_options), self.max_select_count),
-            min_values=0,
-            placeholder=self.placeholder,
-            custom_id=f"selectmenu_{self.message_id}",
-            options=select_options,
-            disabled=not self.enabled,
-        )
+        self.view.add_item(self.build_toggle_button())
 
-        if self.enabled:
+        # Discord limits a select menu to 25 options, so larger menus are split over several select menus
+        for index in range(0, len(select_options), SELECT_OPTION_LIMIT):
+            chunk = select_options[index : index + SELECT_OPTION_LIMIT]
+            # The first select menu keeps the original custom ID format
+            suffix = index // SELECT_OPTION_LIMIT or ""
             self.view.add_item(
-                Button(
-                    label="",
-                    emoji="⏹️",
-                    custom_id=f"disable_{self.message_id}",
-                    style=ButtonStyle.red,
-                )
-            )
-        else:
-            self.view.add_item(
-                Button(
-                    label="",
-                    emoji="▶️",
-                    custom_id=f"enable_{self.message_id}",
-                    style=ButtonStyle.green,
+                Select(
+                    max_values=min(len(chunk), self.max_select_count),
+                    min_values=0,
+                    placeholder=self.placeholder,
+                    custom_id=f"selectmenu{suffix}_{self.message_id}",
+                    options=chunk,
+                    disabled=not self.enabled,
                 )
             )
 
-        self.view.add_item(select_menu)
         self.view = super().build_view()
 
         return self.view
 
 
+# The enabled reaction menus of each bot, keyed by the message ID of the menu
+_enabled_reaction_menus: "WeakKeyDictionary[Bot, Dict[int, ReactionMenu]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_enabled_reaction_menus(bot_instance: Bot) -> Dict[int, "ReactionMenu"]:
+    """Get the enabled reaction menus of a bot. The first time a bot is seen, a single pair of reaction listeners is added to it which dispatch reaction events to the menu of the reacted message.
+
+    Args:
+        bot_instance (Bot): The instance of the bot the menus are enabled on.
+
+    Returns:
+        Dict[int, ReactionMenu]: The enabled reaction menus, keyed by the message ID of the menu.
+    """
+    menus = _enabled_reaction_menus.get(bot_instance)
+    if menus is not None:
+        return menus
+
+    menus = _enabled_reaction_menus[bot_instance] = {}
+
+    async def on_raw_reaction_add(payload: RawReactionActionEvent) -> None:
+        menu = menus.get(payload.message_id)
+        if menu is not None:
+            await menu.on_react_add_event(payload)
+
+    async def on_raw_reaction_remove(payload: RawReactionActionEvent) -> None:
+        menu = menus.get(payload.message_id)
+        if menu is not None:
+            await menu.on_react_remove_event(payload)
+
+    bot_instance.add_listener(on_raw_reaction_add)
+    bot_instance.add_listener(on_raw_reaction_remove)
+    return menus
+
+
 class ReactionMenu(MenuBase):
+    __slots__ = ("react_add_handler", "react_remove_handler")
+
     def __init__(
         self,
         title: str,
@@ -579,7 +739,12 @@ class ReactionMenu(MenuBase):
 
         Args:
             channel (GuildChannel): The channel to send the menu in.
+
+        Raises:
+            ValueError: If the menu does not fit in a single message.
         """
+        self.check_limits()
+
         self.message = await channel.send("_Building reaction menu..._")
         self.message_id = self.message.id
 
@@ -595,7 +760,7 @@ class ReactionMenu(MenuBase):
         """Enables the current menu.
 
         Args:
-            bot_instance (Bot): The instance of the bot to add the listeners to.
+            bot_instance (Bot): The instance of the bot to enable the menu on.
 
         Returns:
             bool: True if the menu was enabled, False otherwise.
@@ -603,10 +768,7 @@ class ReactionMenu(MenuBase):
         if not self.enabled:
             self.enabled = True
             await self.update_menu()
-            bot_instance.add_listener(self.on_react_add_event, "on_raw_reaction_add")
-            bot_instance.add_listener(
-                self.on_react_remove_event, "on_raw_reaction_remove"
-            )
+            _get_enabled_reaction_menus(bot_instance)[self.message_id] = self
             return True
         return False
 
@@ -614,17 +776,14 @@ class ReactionMenu(MenuBase):
         """Disables the current menu.
 
         Args:
-            bot_instance (Bot): The instance of the bot to remove the listeners to.
+            bot_instance (Bot): The instance of the bot to disable the menu on.
 
         Returns:
             bool: True if the menu was disabled, False otherwise.
         """
         if self.enabled:
             self.enabled = False
-            bot_instance.remove_listener(self.on_react_add_event, "on_raw_reaction_add")
-            bot_instance.remove_listener(
-                self.on_react_remove_event, "on_raw_reaction_remove"
-            )
+            _get_enabled_reaction_menus(bot_instance).pop(self.message_id, None)
             await self.update_menu()
             return True
         return False
@@ -638,11 +797,26 @@ class ReactionMenu(MenuBase):
         if not self.message:
             raise ValueError("Cannot update message before creation!")
 
-        await self.message.edit(content="", embed=self.build_embed())
-        self.message = await self.message.channel.fetch_message(self.message_id)
+        # The edited message is returned with its current reactions, so no fetch is needed
+        self.message = await self.message.edit(content="", embeds=self.build_embeds())
         if self.enabled:
             await self.add_reactions()
 
+    async def refresh_message(self) -> Message:
+        """Fetch the menu's message again so that its reactions are up to date. Reaction events do not refresh the message, so handlers that read the message's reactions should call this first.
+
+        Returns:
+            Message: The refreshed message of the menu.
+
+        Raises:
+            ValueError: If the message has not been created ValueError will be raised.
+        """
+        if not self.message:
+            raise ValueError("Cannot refresh message before creation!")
+
+        self.message = await self.message.channel.fetch_message(self.message_id)
+        return self.message
+
     async def add_reactions(self, message: Message = None) -> None:
         """Add the reactions to the menu for users to click on.
 
@@ -658,23 +832,30 @@ class ReactionMenu(MenuBase):
         if message is None:
             message = self.message
 
-        missing_emojis = [x.id for x in self.options.values()]
-        for react in self.message.reactions:
-            react_emoji = ReactionEmoji(react.emoji)
-            if react_emoji.emoji_id in missing_emojis:
-                missing_emojis.remove(react_emoji.emoji_id)
-            else:
-                await react.clear()
+        current_reactions = {
+            ReactionEmoji(react.emoji).emoji_id: react for react in message.reactions
+        }
+
+        # Clearing unrelated reactions can happen in any order, so do it concurrently
+        await asyncio.gather(
+            *(
+                react.clear()
+                for emoji_id, react in current_reactions.items()
+                if emoji_id not in self.options
+            )
+        )
 
-        for emoji_id in missing_emojis:
-            emoji = self.options.get(emoji_id).emoji
+        # Reactions are displayed in the order they are added, so add them one at a time
+        for emoji_id, option in self.options.items():
+            if emoji_id in current_reactions:
+                continue
             try:
-                await message.add_reaction(emoji)
+                await message.add_reaction(option.emoji)
             except HTTPException:
                 pass
 
     async def on_react_add_event(self, payload: RawReactionActionEvent) -> Any:
-        """The event handler for when a reaction is added to a message.
+        """The event handler for when a reaction is added to a message. The menu's message is not fetched again for each event, so its reactions may be out of date; use refresh_message to update them.
 
         Args:
             payload (RawReactionActionEvent): The reaction event payload data.
@@ -685,22 +866,21 @@ class ReactionMenu(MenuBase):
         if payload is None:
             return None
 
-        if payload.member.bot:
+        if payload.message_id != self.message_id:
             return None
 
-        if payload.message_id != self.message_id:
+        if payload.member is not None and payload.member.bot:
             return None
 
         if self.react_add_handler is None:
             return None
 
         if self.enabled:
-            self.message = await self.message.channel.fetch_message(payload.message_id)
             return await self.react_add_handler(payload)
         return None
 
     async def on_react_remove_event(self, payload: RawReactionActionEvent) -> Any:
-        """The event handler for when a reaction is removed from a message.
+        """The event handler for when a reaction is removed from a message. The menu's message is not fetched again for each event, so its reactions may be out of date; use refresh_message to update them.
 
         Args:
             payload (RawReactionActionEvent): The reaction event payload data.
@@ -718,12 +898,13 @@ class ReactionMenu(MenuBase):
             return None
 
         if self.enabled:
-            self.message = await self.message.channel.fetch_message(payload.message_id)
             return await self.react_remove_handler(payload)
         return None
 
 
 class MenuOption:
+    __slots__ = ("_emoji", "reaction_count", "_description")
+
     def __init__(self, emoji: ReactionEmoji, description: Any, reaction_count: int = 0):
         """Creates a menu option object. Stores any relevant data to each option.
 
@@ -757,8 +938,8 @@ class MenuOption:
         """
         data["emoji"] = ReactionEmoji(data["emoji"])
         try:
-            data["reaction_count"] = int(data.get("reaction_count"))
-        except ValueError:
+            data["reaction_count"] = int(data.get("reaction_count", 0))
+        except (TypeError, ValueError):
             data["reaction_count"] = 0
         return MenuOption(**data)
 
@@ -769,9 +950,7 @@ class MenuOption:
         Returns:
             str: The description in a Discord format.
         """
-        if isinstance(self._description, Role) or isinstance(
-            self._description, GuildChannel
-        ):
+        if isinstance(self._description, (Role, GuildChannel)):
             return self._description.mention
         else:
             return str(self._description)
@@ -815,4 +994,4 @@ class MenuOption:
         return f"{self.emoji} **—** {self.description}"
 
     def __repr__(self) -> str:
-        return f"{{Emoji: {self.emoji.discord_emoji}, Description: {self.description!r}, Reaction Count: {self.reaction_count!r}}}"
+        return f"{{Emoji: {self.emoji}, Description: {self.description!r}, Reaction Count: {self.reaction_count!r}}}"
@@ -1,6 +1,7 @@
 from ReactableMenus.ReactableMenu import (
     MenuBase,
     MenuOption,
+    InteractionMenu,
     ButtonMenu,
     SelectMenu,
     ReactionMenu,